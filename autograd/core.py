@@ -3,8 +3,8 @@ from itertools import count
 from typing import Callable, Iterable
 from typing_extensions import override
 
-from .tracer import Box, Node, getval, isbox, primitive, toposort, trace
-from .util import func, subval
+from .tracer import Box, Node, getval, isbox, primitive, trace
+from .util import func, subval, walk_tape
 
 # -------------------- reverse mode --------------------
 
@@ -26,7 +26,7 @@ def make_vjp(fun, x):
 
 def backward_pass(g, end_node):
     outgrads = {end_node: (g, False)}
-    for node in toposort(end_node):
+    for node in walk_tape(end_node):
         outgrad = outgrads.pop(node)
         ingrads = node.vjp(outgrad[0])
         for parent, ingrad in zip(node.parents, ingrads):
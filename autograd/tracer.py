@@ -1,18 +1,24 @@
 from typing import Callable
 import warnings
 from collections import defaultdict
-from contextlib import contextmanager
+from types import MappingProxyType
 from abc import abstractmethod
 
-from autograd.util import subvals, toposort
+from autograd.util import toposort
 from functools import wraps
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
 
 class Node:
-    r"""An autograd node."""
+    r"""An autograd node.
+
+    Subclasses define `__slots__` and override `__init__`, which `primitive`
+    calls once per traced operation with `kwargs` passed positionally and
+    `parent_argnums`/`parents` as parallel tuples. Roots are created with
+    `new_root`, which bypasses `__init__` entirely."""
     __slots__ = []
 
     def __init__(self, value, fun, args, kwargs, parent_argnums, parents):
@@ -33,8 +39,10 @@ def trace(start_node, fun, x):
 
     Note that the boxed argument may be a `SequenceBox` or `DictBox`, in which
     case it is a container of multiple arguments."""
-    with trace_stack.new_trace() as t:
-        logger.info("New trace (stack_id=%s) started for function %s at %s", t, fun, x)
+    with _new_trace_cm as t:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("New trace (stack_id=%s) started for function %s at %s",
+                        t, fun, x)
         start_box = new_box(x, t, start_node)
         end_box = fun(start_box)
         if isbox(end_box) and end_box._trace == start_box._trace:
@@ -53,53 +61,104 @@ def primitive(f_raw: Callable):
     the function has boxed arguments (and it is not part of `notrace_primitives`),
     the function is executed with boxes unwrapped, and the output is boxed."""
 
-    @wraps(f_raw)
-    def f_wrapped(*args, **kwargs):
-        # Fetch the (boxed) arguments corresponding to the most recent trace:
-        boxed_args, trace, node_constructor = find_top_boxed_args(args)
+    @wraps(f_raw, updated=())
+    # Module-level names used on every call are bound as (keyword-only)
+    # default arguments, so they are read as locals rather than globals:
+    def f_wrapped(*args, _box_types=box_types, _new_box=new_box, **kwargs):
+        if len(args) == 1 and type(args[0]) in _box_types:
+            # Fast path for the (common) unary case, e.g. `np.exp(x)`:
+            box = args[0]
+            trace = box._trace
+            node_constructor = type(box._node)
+            argvals = (box._value, )
+            argnums = (0, )
+            parents = (box._node, )
+        else:
+            # Fetch the (boxed) arguments corresponding to the most recent
+            # trace in a single pass over the arguments (see
+            # `find_top_boxed_args`):
+            trace = -1
+            node_constructor = None
+            for argnum, arg in enumerate(args):
+                if type(arg) in _box_types:
+                    arg_trace = arg._trace
+                    if arg_trace > trace:
+                        trace = arg_trace
+                        node_constructor = type(arg._node)
+                        argnums = (argnum, )
+                        parents = (arg._node, )
+                    elif arg_trace == trace:
+                        argnums += (argnum, )
+                        parents += (arg._node, )
+
+            if node_constructor is None:
+                # If no boxed arguments, just return the function, we do not
+                # need to differentiate wrt any arguments here:
+                return f_raw(*args, **kwargs)
 
-        if boxed_args:
             # Unwrap boxed arguments corresponding to most recent trace:
             # TODO(manan): it's still unclear how multiple traces work...
-            argvals = subvals(args, [(argnum, box._value)
-                                     for argnum, box in boxed_args])
-
-            if f_wrapped in notrace_primitives[node_constructor]:
-                # If we do not trace this primitive, return directly:
-                return f_wrapped(*argvals, **kwargs)
-
-            # Otherwise, compute the output and box it (with the same
-            # node type as the input arguments):
-            ans = f_wrapped(*argvals, **kwargs)
-
-            parents = tuple(box._node for _, box in boxed_args)
-            argnums = tuple(argnum for argnum, _ in boxed_args)
-            node = node_constructor(ans, f_wrapped, argvals, kwargs, argnums,
-                                    parents)
-            return new_box(ans, trace, node)
-        else:
-            # If no boxed arguments, just return the function, we do not need
-            # to differentiate wrt any arguments here:
-            return f_raw(*args, **kwargs)
+            argvals = list(args)
+            if len(argnums) == 1:
+                # A single boxed argument among several (e.g. `x * W` with
+                # only `W` boxed) is the common case; skip the loop:
+                argnum, = argnums
+                argvals[argnum] = args[argnum]._value
+            else:
+                for argnum in argnums:
+                    argvals[argnum] = args[argnum]._value
+            # Nodes and user-defined VJP/JVP makers receive `argvals` as a
+            # tuple, so keep it one:
+            argvals = tuple(argvals)
+
+        # Under higher-order differentiation, `argvals` may still hold boxes
+        # from outer (lower) traces, which `f_wrapped` must handle. Only the
+        # outermost trace (0) is guaranteed to leave no boxes, in which case
+        # we can skip re-scanning the arguments and call `f_raw` directly:
+        f = f_raw if trace == 0 else f_wrapped
+
+        if node_constructor in f_wrapped._notrace_for:
+            # If we do not trace this primitive, return directly:
+            return f(*argvals, **kwargs)
+
+        # Otherwise, compute the output and box it (with the same
+        # node type as the input arguments). Nodes may hold on to `kwargs`
+        # for the lifetime of the tape, so share a single read-only empty
+        # mapping rather than keeping a fresh empty dict per node:
+        if not kwargs:
+            kwargs = _EMPTY_KWARGS
+        ans = f(*argvals, **kwargs)
+        node = node_constructor(ans, f_wrapped, argvals, kwargs, argnums,
+                                parents)
+        return _new_box(ans, trace, node)
 
     # Metadata:
     f_wrapped.fun = f_raw
     f_wrapped._is_autograd_primitive = True
+    f_wrapped._notrace_for = _EMPTY
     return f_wrapped
 
 
 notrace_primitives = defaultdict(set)
+_EMPTY = frozenset()
+_EMPTY_KWARGS = MappingProxyType({})
 
 
 def register_notrace(trace_type, primitive_fun):
+    r"""Registers `primitive_fun` as not traced by nodes of type `trace_type`.
+    The node types are also stored on the function itself (as
+    `_notrace_for`), so that `primitive` can check them with a single
+    attribute read."""
     notrace_primitives[trace_type].add(primitive_fun)
+    primitive_fun._notrace_for = getattr(primitive_fun, "_notrace_for",
+                                         _EMPTY) | {trace_type}
 
 
 def notrace_primitive(f_raw):
 
-    @wraps(f_raw)
-    def f_wrapped(*args, **kwargs):
-        argvals = map(getval, args)
+    @wraps(f_raw, updated=())
+    def f_wrapped(*args, _getval=getval, **kwargs):
+        argvals = map(_getval, args)
         return f_raw(*argvals, **kwargs)
 
     f_wrapped._is_primitive = True
@@ -110,7 +169,10 @@ def find_top_boxed_args(args: list):
     r"""Find the topmost boxed argument in the list of arguments; that is,
     for a function that takes a list of arguments that has been traced
     multiple times, find the arguments that correspond to the most recent
-    trace."""
+    trace.
+
+    `primitive` performs this scan inline; this function is kept for
+    external callers."""
 
     # Traces are ascending: 0 is the lowest, N is the highest (for N
     # traces):
@@ -135,22 +197,43 @@ def find_top_boxed_args(args: list):
     return top_boxes, top_trace, top_node_type
 
 
-class TraceStack:
+class TraceStack(threading.local):
     r"""Manages a stack of traces (tracing traces, for example). This is done
     simply, by maintaining a `top` value that is incremented with each trace
-    start."""
+    start.
+
+    The stack is thread-local (`__init__` runs once per thread), so gradients
+    can be evaluated concurrently from several threads."""
 
     def __init__(self):
         self.top = -1
 
-    @contextmanager
     def new_trace(self):
-        self.top += 1
-        yield self.top
-        self.top -= 1
+        return _NewTrace(self)
+
+
+class _NewTrace:
+    r"""Context manager that pushes a new trace onto a `TraceStack`. Written
+    as a plain class (rather than with `contextmanager`) since it is entered
+    on every call to `trace`. The trace level lives on the (thread-local)
+    stack, so a single instance is re-entrant and can be shared by all
+    threads; `trace` uses the module-level `_new_trace_cm`."""
+    __slots__ = ["stack"]
+
+    def __init__(self, stack):
+        self.stack = stack
+
+    def __enter__(self):
+        stack = self.stack
+        stack.top += 1
+        return stack.top
+
+    def __exit__(self, *exc_info):
+        self.stack.top -= 1
 
 
 trace_stack = TraceStack()
+_new_trace_cm = trace_stack.new_trace()
 
 
 class Box:
@@ -183,16 +266,27 @@ class Box:
 box_type_mappings = Box.type_mappings
 
 
-def new_box(value, trace, node):
-    try:
-        out = box_type_mappings[type(value)](value, trace, node)
-        logger.info("Created box %s", out)
-        return out
-    except KeyError:
+def new_box(value, trace, node, _get_box_type=box_type_mappings.get):
+    # `tracer` does not depend on numpy, so there is no ndarray fast path
+    # here; a single probe of the (bound) `dict.get` is already the cheapest
+    # dispatch on the value type.
+    box_type = _get_box_type(type(value))
+    if box_type is None:
         raise TypeError(f"Can't differentiate w.r.t. type {type(value)}")
+    out = box_type(value, trace, node)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Created box %s", out)
+    return out
 
 
 box_types = Box.types
-isbox = lambda x: type(
-    x) in box_types  # almost 3X faster than isinstance(x, Box)
-getval = lambda x: getval(x._value) if isbox(x) else x
+# Almost 3X faster than isinstance(x, Box). `box_types` is bound as a default
+# argument so the lookup is local rather than global:
+isbox = lambda x, _box_types=box_types: type(x) in _box_types
+
+
+def getval(x, _box_types=box_types):
+    r"""Unwraps `x` from any (nested) boxes it is contained in."""
+    while type(x) in _box_types:
+        x = x._value
+    return x
@@ -42,6 +42,29 @@ def toposort(end_node, parents=operator.attrgetter("parents")):
                 child_counts[parent] -= 1
 
 
+def walk_tape(end_node, parents=operator.attrgetter("parents")):
+    r"""Returns the nodes reachable from `end_node` in topological order
+    (`end_node` first, every node before its parents), as `toposort` does.
+
+    This is an iterative depth-first search returning the reverse post-order,
+    which needs a single pass over the graph and no per-node child counts."""
+    visited = {end_node}
+    order = []
+    stack = [(end_node, iter(parents(end_node)))]
+    while stack:
+        node, unvisited_parents = stack[-1]
+        for parent in unvisited_parents:
+            if parent not in visited:
+                visited.add(parent)
+                stack.append((parent, iter(parents(parent))))
+                break
+        else:
+            stack.pop()
+            order.append(node)
+    order.reverse()
+    return order
+
+
 # -------------------- deprecation warnings -----------------------
 
 import warnings
@@ -1,4 +1,3 @@
-from autograd.util import subvals
 from functools import wraps as fct_wraps
 
 from typing import Any, Callable, Iterable, Union
@@ -33,6 +32,45 @@ def unary_to_nary(unary_operator: Callable):
         specified to slice inputs of `unary_operator`. 
         """
 
+        # `argnum` is fixed for the lifetime of the returned function, so we
+        # choose how to substitute arguments (and build `make_unary_f`) once
+        # here rather than on every call to `nary_f`:
+        if isinstance(argnum, int):
+            # `args[argnum + 1:]` would be all of `args` for `argnum == -1`:
+            after = slice(argnum + 1, None) if argnum != -1 else slice(0, 0)
+
+            def make_unary_f(args, kwargs):
+                before_args, after_args = args[:argnum], args[after]
+
+                @fct_wraps(fun)
+                def unary_f(x):
+                    r"""Overwrites the location specified by `argnum` in
+                    `fun`'s arguments with `x`."""
+                    return fun(*before_args, x, *after_args, **kwargs)
+
+                return unary_f, args[argnum]
+        else:
+            assert isinstance(argnum, Iterable)
+            argnum_tuple = tuple(argnum)
+
+            def make_unary_f(args, kwargs):
+
+                @fct_wraps(fun)
+                def unary_f(xs):
+                    r"""Overwrites the locations specified by `argnum` in
+                    `fun`'s arguments with the values in `xs`."""
+                    # for a_i in argnums: args[a_i] = x_i
+                    subargs = list(args)
+                    for i, x in zip(argnum_tuple, xs):
+                        subargs[i] = x
+                    return fun(*subargs, **kwargs)
+
+                return unary_f, tuple(args[i] for i in argnum_tuple)
+
+        # With a single argument and `argnum == 0`, `fun` can be passed to
+        # `unary_operator` as is:
+        fun_is_unary = isinstance(argnum, int) and argnum == 0
+
         # Wrap with `wrap_nary_f` (instead of `wraps`) so we can inject a custom
         # docstring:
         @wrap_nary_f(fun, unary_operator, argnum)
@@ -45,34 +83,20 @@ def unary_to_nary(unary_operator: Callable):
             to track gradients. The other (free) arguments are not wrapped as
             Boxes."""
 
-            @fct_wraps(fun)
-            def unary_f(x):
-                r"""Overwrites the locations specified by `argnum` in `fun`'s
-                arguments to correspond to the values in `x`."""
-                if isinstance(argnum, int):
-                    # args[argnum] = x
-                    subargs = subvals(args, [(argnum, x)])
-                else:
-                    assert isinstance(argnum, Iterable)
-                    # for a_i in argnums: args[a_i] = x_i
-                    subargs = subvals(args, zip(argnum, x))
-
-                # Return an evaluation of `fun` with the overwritten
-                # arguments:
-                return fun(*subargs, **kwargs)
-
-            if isinstance(argnum, int):
-                x = args[argnum]
-            else:
-                x = tuple(args[i] for i in argnum)
-
-            # Return an instance of `unary_operator` (the function we are wrapping),
-            # with `x` being the sliced set of arguments that we select with
-            # `argnum`. `fun` is wrapped with `unary_f`, which maintains references
-            # to the arguments passed to `unary_operator` (so we can call `fun`)
-            # and overrides the relevant parameters (those specified by `argnum`)
-            # with whatever is passed in to the function. All other parameters are
-            # fixed.
+            if fun_is_unary and len(args) == 1 and not kwargs:
+                # `fun` is already unary, so no adapter is needed:
+                return unary_operator(fun, args[0], *nary_op_args,
+                                      **nary_op_kwargs)
+
+            # `unary_f` maintains references to the arguments passed to
+            # `nary_f` (so we can call `fun`) and overrides the relevant
+            # parameters (those specified by `argnum`) with whatever is passed
+            # in to it. All other parameters are fixed. `x` is the sliced set
+            # of arguments that we select with `argnum`.
+            unary_f, x = make_unary_f(args, kwargs)
+
+            # Return an instance of `unary_operator` (the function we are
+            # wrapping):
             return unary_operator(unary_f, x, *nary_op_args, **nary_op_kwargs)
 
         return nary_f
@@ -1,9 +1,12 @@
 """This file doesn't import the numpy wrapper, to check if core works
 on basic operations even without numpy."""
 
+import threading
 import warnings
 
-from autograd.core import make_vjp
+from autograd.core import defvjp, make_vjp
+from autograd.tracer import primitive
+from autograd.util import walk_tape
 from autograd.wrap_util import unary_to_nary
 
 
@@ -80,3 +83,50 @@ def test_lt():
 
 def test_gt():
     check_binary_func(lambda x, y: x > y, independent=True)
+
+
+def test_walk_tape_order():
+
+    class N:
+
+        def __init__(self, *parents):
+            self.parents = parents
+
+    a = N()
+    b, c = N(a), N(a)
+    d = N(b, c, b)
+    order = walk_tape(d)
+    assert order[0] is d and order[-1] is a and len(order) == 4
+    position = {node: i for i, node in enumerate(order)}
+    assert all(position[p] > position[n] for n in order for p in n.parents)
+
+
+def test_concurrent_traces_are_thread_local():
+    num_threads = 4
+    # Time out (failing the asserts below) rather than hang if a thread
+    # fails before reaching the barrier:
+    barrier = threading.Barrier(num_threads, timeout=10)
+    traces, grads = [], []
+
+    @primitive
+    def wait(x):
+        barrier.wait()
+        return x
+
+    defvjp(wait, lambda ans, x: lambda g: g)
+
+    def fun(x):
+        # Every thread is inside its own (outermost) trace here:
+        traces.append(x._trace)
+        return wait(x) * x
+
+    def run():
+        grads.append(grad(fun)(3.0))
+
+    threads = [threading.Thread(target=run) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    assert traces == [0] * num_threads
+    assert grads == [6.0] * num_threads
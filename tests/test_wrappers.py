@@ -115,6 +115,19 @@ def test_multigrad_onearg():
         grad(fun, argnum=[0])(A, B), (grad(packed_fun)((A, B))[0], ))
 
 
+def test_multigrad_array_argnum():
+    fun = lambda x, y: x * y**2
+    check_equivalent(grad(fun, argnum=np.array([0, 1]))(1.0, 2.0),
+                     (4.0, 4.0))
+
+
+def test_negative_argnum():
+    fun = lambda x, y, z: np.sum(x * np.sin(y) * z)
+    A, B, C = npr.randn(3), npr.randn(3), npr.randn(3)
+    check_equivalent(grad(fun, argnum=-1)(A, B, C), grad(fun, argnum=2)(A, B, C))
+    check_equivalent(grad(fun, argnum=-2)(A, B, C), grad(fun, argnum=1)(A, B, C))
+
+
 def test_elementwise_grad():
 
     def simple_fun(a):